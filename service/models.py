@@ -87,15 +87,22 @@ class Product(db.Model):
     def __repr__(self):
         return f"<Product {self.name} id=[{self.id}]>"
 
-    def create(self):
+    def create(self, commit: bool = True):
         """
         Creates a Product to the database
+
+        :param commit: False to only flush, so the caller can commit
+            several products in a single transaction
+        :type commit: bool
         """
         logger.info("Creating %s", self.name)
         # id must be none to generate next primary key
         self.id = None  # pylint: disable=invalid-name
         db.session.add(self)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
 
     def update(self):
         """
@@ -211,6 +218,8 @@ class Product(db.Model):
         :param price: the price to search for
         :type name: float
 
+        :raises TypeError: if the price is not a number or a string
+
         :return: a collection of Products with that price
         :rtype: list
 
@@ -219,6 +228,8 @@ class Product(db.Model):
         price_value = price
         if isinstance(price, str):
             price_value = Decimal(price.strip(' "'))
+        elif not isinstance(price, (Decimal, float, int)):
+            raise TypeError("Invalid type for price: " + str(type(price)))
         return cls.query.filter(cls.price == price_value)
 
     @classmethod